@@ -14,14 +14,29 @@
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import sys
 import time
 from dataclasses import dataclass
+from itertools import chain
 from datetime import date, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from aqt.operations import QueryOp
 
+try:
+    # Anki 本体に同梱されている高速 JSON パーサ（無ければ標準 json）
+    import orjson
+except ImportError:
+    orjson = None
+
+from anki.errors import NotFoundError
 from anki.notes import Note
+from anki.utils import ids2str
 
 from aqt import mw, gui_hooks, dialogs
 from aqt.qt import (
@@ -36,17 +51,22 @@ from aqt.qt import (
     Qt,
     QShortcut,
     QKeySequence,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QAbstractItemView,
+    QAbstractListModel,
+    QModelIndex,
+    QFont,
     QComboBox,
     QMenu,
     QColor,
+    QBrush,
     QWheelEvent,
     QFileDialog,
     QSize,
     QDateEdit,
     QDate,
     QInputDialog,
+    QTimer,
 )
 
 import html
@@ -85,12 +105,68 @@ def _load_max_display_memos() -> int:
     return 500
 
 
+# ===== JSON 読み書き =====
+
+def _json_loads(raw: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> str:
+    # フィールドに入れるだけなので、インデント無しの詰めた形で書く
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 # ===== ユーティリティ =====
 
+# ノートタイプID -> (mod, _MemoLog のフィールド位置 or None)
+# mod も持っておき、ノートタイプが編集されたら計算し直す
+_MODEL_MEMO_ORD: Dict[int, Tuple[int, Optional[int]]] = {}
+
+
+def _model_memo_ord(model: Dict[str, Any]) -> Optional[int]:
+    """ノートタイプ内の _MemoLog フィールド位置（無ければ None）を返す"""
+    mid = model["id"]
+    mod = model.get("mod", 0)
+    cached = _MODEL_MEMO_ORD.get(mid)
+    if cached is not None and cached[0] == mod:
+        return cached[1]
+
+    memo_ord: Optional[int] = None
+    for i, fld in enumerate(model.get("flds", [])):
+        if fld.get("name") == MEMO_FIELD_NAME:
+            memo_ord = i
+            break
+    _MODEL_MEMO_ORD[mid] = (mod, memo_ord)
+    return memo_ord
+
+
+def _model_has_memo(model: Dict[str, Any]) -> bool:
+    return _model_memo_ord(model) is not None
+
+
+def _note_memo_ord(note: Note) -> Optional[int]:
+    """ノートの _MemoLog フィールド位置（無ければ None）"""
+    return _model_memo_ord(note.model())
+
+
 def _note_has_memo_field(note: Note) -> bool:
-    model = note.model()
-    fields = mw.col.models.field_names(model)
-    return MEMO_FIELD_NAME in fields
+    return _note_memo_ord(note) is not None
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _front_snippet(front_raw: str) -> str:
+    """Front フィールドからタグを除いた 50 文字までの抜粋を作る"""
+    # タグが無ければ正規表現を通さない
+    front_snip = _TAG_RE.sub("", front_raw) if "<" in front_raw else front_raw
+    if len(front_snip) > 50:
+        front_snip = f"{front_snip[:50]}..."
+    return front_snip
 
 
 def _ensure_memo_field_or_warn(note: Note) -> bool:
@@ -108,17 +184,40 @@ def _ensure_memo_field_or_warn(note: Note) -> bool:
     return False
 
 
+# メモの各エントリは必ず "text" キーを持つので、これを含まないフィールドは
+# JSON をパースするまでもなく空とみなせる
+_MEMO_TEXT_KEY = '"text"'
+
+# nid -> (_MemoLog の生文字列, パース済みメモログ)
+# 同じノートへの追加・編集・削除が続いても、毎回 JSON を読み直さないように
+_MEMO_LOG_CACHE: Dict[int, Tuple[str, List[Dict[str, Any]]]] = {}
+
+
 def _load_memo_log(note: Note) -> List[Dict[str, Any]]:
     """Note の _MemoLog フィールドからメモログ(JSON)を読み取る"""
-    if not _note_has_memo_field(note):
+    memo_ord = _note_memo_ord(note)
+    if memo_ord is None:
         return []
+    # フィールド名で引かず、位置で直接読む
+    raw = note.fields[memo_ord]
+    cached = _MEMO_LOG_CACHE.get(note.id)
+    if cached is not None and cached[0] == raw:
+        logs = cached[1]
+    else:
+        logs = _parse_memo_log(raw)
+        _MEMO_LOG_CACHE[note.id] = (raw, logs)
+    # 呼び出し側が書き換えるので、キャッシュ本体ではなくコピーを返す
+    return [dict(ent) for ent in logs]
+
 
-    raw = note[MEMO_FIELD_NAME].strip()
-    if not raw:
+def _parse_memo_log(raw: str) -> List[Dict[str, Any]]:
+    """_MemoLog フィールドの生文字列をメモログのリストに変換する"""
+    raw = raw.strip()
+    if not raw or _MEMO_TEXT_KEY not in raw:
         return []
 
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
         if isinstance(data, list):
             cleaned = []
             for item in data:
@@ -135,89 +234,319 @@ def _load_memo_log(note: Note) -> List[Dict[str, Any]]:
     return []
 
 
-def _save_memo_log(note: Note, entries: List[Dict[str, Any]]) -> None:
-    """メモログ(JSON)を _MemoLog フィールドに保存"""
-    if not _note_has_memo_field(note):
-        return
-    if not entries:
-        note[MEMO_FIELD_NAME] = ""
-    else:
-        note[MEMO_FIELD_NAME] = json.dumps(entries, ensure_ascii=False, indent=2)
+def _find_memo_log_index(
+    logs: List[Dict[str, Any]], ts: int, text: str
+) -> Optional[int]:
+    """メモログ内で (ts, text) が一致する最初のエントリの位置を返す"""
+    for i, ent in enumerate(logs):
+        if ent["ts"] == ts and ent["text"] == text:
+            return i
+    return None
+
+
+def _set_memo_log(note: Note, entries: List[Dict[str, Any]]) -> bool:
+    """
+    メモログ(JSON)を _MemoLog フィールドにセットする（DB にはまだ書かない）。
+    中身が変わらない場合は何もしない（変わったら True）。
+    """
+    memo_ord = _note_memo_ord(note)
+    if memo_ord is None:
+        return False
+    raw = _json_dumps(entries) if entries else ""
+    if raw == note.fields[memo_ord]:
+        return False
+    note.fields[memo_ord] = raw
+    # 書いた内容をそのままキャッシュしておく（次の読み込みでパース不要）
+    _MEMO_LOG_CACHE[note.id] = (raw, [dict(ent) for ent in entries])
+    return True
+
+
+def _save_memo_log(note: Note, entries: List[Dict[str, Any]]) -> bool:
+    """
+    メモログ(JSON)を _MemoLog フィールドに保存。
+    中身が変わらない場合は書き込まない（実際に保存したら True）。
+    """
+    if not _set_memo_log(note, entries):
+        return False
     note.flush()
+    return True
 
 
 # ===== 全ノートからメモを集める =====
 
-@dataclass
+@dataclass(eq=False)
 class GlobalMemoEntry:
+    # 件数が多くなるので __dict__ を持たせない
+    # （dataclass(slots=True) は Python 3.10 以降のため手で書く）
+    # 比較は同一オブジェクトかどうかだけでよい（編集もその場で書き換える）
+    __slots__ = (
+        "ts", "text", "nid", "deck_name", "front_snip", "date_iso", "day_ord",
+    )
+
     ts: int
     text: str
     nid: int
     deck_name: str
     front_snip: str
+    # ts のローカル日付（再描画・フィルタのたびに計算しないよう保持）
+    date_iso: str
+    day_ord: int
+
+
+def _make_global_entry(
+    ts: int, text: str, nid: int, deck_name: str, front_snip: str
+) -> GlobalMemoEntry:
+    d = date.fromtimestamp(ts)
+    return GlobalMemoEntry(
+        ts=ts,
+        text=text,
+        nid=nid,
+        deck_name=deck_name,
+        front_snip=front_snip,
+        # 同じ日のエントリで同じ文字列オブジェクトを共有する
+        date_iso=sys.intern(d.isoformat()),
+        day_ord=d.toordinal(),
+    )
 
 
-def _collect_all_memo_entries(col) -> List[GlobalMemoEntry]:
-    """コレクション内のすべての _MemoLog からメモを時系列で集める"""
-    entries: List[GlobalMemoEntry] = []
-    if not col:
-        return entries
+def _entries_from_rows(
+    rows: List[Tuple[int, int, str, Optional[int]]],
+    memo_ords: Dict[int, int],
+    deck_names: Dict[int, str],
+) -> Dict[int, List[GlobalMemoEntry]]:
+    """
+    (nid, mid, flds, did) の行からメモを取り出し、ノートID ごとにまとめる。
+    コレクションには触らないので、SQL を読み終えた後の純粋な計算だけになる。
+    """
+    by_nid: Dict[int, List[GlobalMemoEntry]] = {}
 
-    try:
-        nids = col.find_notes(f"{MEMO_FIELD_NAME}:*")
-    except Exception:
-        return entries
+    for nid, mid, flds, did in rows:
+        memo_ord = memo_ords[mid]
 
-    import re
+        fields = flds.split("\x1f")
+        if memo_ord >= len(fields):
+            continue
 
-    for nid in nids:
-        note = col.get_note(nid)
-        if note is None or not _note_has_memo_field(note):
+        # パース前に生文字列で足切り
+        raw = fields[memo_ord]
+        if _MEMO_TEXT_KEY not in raw:
             continue
 
-        logs = _load_memo_log(note)
+        logs = _parse_memo_log(raw)
         if not logs:
             continue
 
-        # カード & デッキ情報
-        cards = list(note.cards())
-        if cards:
-            card = cards[0]
-            deck_name = col.decks.name(card.did)
-        else:
-            deck_name = "(no deck)"
-
-        # Front 抜粋
-        model = note.model()
-        fnames = col.models.field_names(model)
-        if fnames:
-            front_raw = note[fnames[0]]
-            front_snip = re.sub(r"<[^>]+>", "", front_raw)
-            if len(front_snip) > 50:
-                front_snip = front_snip[:50] + "..."
-        else:
-            front_snip = ""
+        # デッキ情報（カードが無ければ "(no deck)"）
+        deck_name = deck_names.get(did, "(no deck)") if did is not None else "(no deck)"
 
-        for item in logs:
-            ts = int(item.get("ts", int(time.time())))
-            text = str(item.get("text", "")).strip()
-            if not text:
-                continue
-            entries.append(
-                GlobalMemoEntry(
-                    ts=ts,
-                    text=text,
-                    nid=nid,
-                    deck_name=deck_name,
-                    front_snip=front_snip,
-                )
+        # Front 抜粋（先頭フィールド）
+        front_snip = _front_snippet(fields[0])
+
+        by_nid[nid] = [
+            _make_global_entry(
+                ts=item["ts"],
+                text=item["text"],
+                nid=nid,
+                deck_name=deck_name,
+                front_snip=front_snip,
+            )
+            for item in logs
+        ]
+
+    return by_nid
+
+
+def _memo_note_types(col) -> Dict[int, int]:
+    """_MemoLog フィールドを持つノートタイプの {ノートタイプID: フィールド位置}"""
+    memo_ords: Dict[int, int] = {}
+    for nt in col.models.all_names_and_ids():
+        model = col.models.get(nt.id)
+        memo_ord = _model_memo_ord(model) if model else None
+        if memo_ord is not None:
+            memo_ords[nt.id] = memo_ord
+    return memo_ords
+
+
+def _collect_memo_entries_by_note(
+    col, known_mods: Dict[int, int]
+) -> Tuple[Dict[int, List[GlobalMemoEntry]], Dict[int, int], List[int]]:
+    """
+    コレクション内の _MemoLog からメモを集め、ノートID ごとに返す。
+    known_mods（前回読み込んだ時点の {ノートID: mod}）と比べて、
+    新規・更新されたノートだけを読み直す（空なら全件読み込み）。
+
+    戻り値: (読み直したノートのメモ, 現在の {ノートID: mod}, 読み直したノートID)
+    現在の {ノートID: mod} に無いノートは、削除されたかメモ対象外になったもの。
+    """
+    if not col:
+        return {}, {}, []
+
+    # _MemoLog フィールドを持つノートタイプだけを対象にする
+    try:
+        memo_ords = _memo_note_types(col)
+    except Exception:
+        return {}, {}, []
+
+    if not memo_ords:
+        return {}, {}, []
+
+    # mod だけなら flds を読むより遥かに軽い
+    current_mods: Dict[int, int] = dict(
+        col.db.all(f"select id, mod from notes where mid in {ids2str(memo_ords)}")
+    )
+
+    # デッキ名は最初に1回だけ引いておく
+    deck_names: Dict[int, str] = {
+        d.id: d.name for d in col.decks.all_names_and_ids()
+    }
+
+    # Note / Card オブジェクトを作らず、1回の SQL でまとめて読む
+    sql = (
+        "select n.id, n.mid, n.flds, "
+        "(select c.did from cards c where c.nid = n.id order by c.ord limit 1) "
+        f"from notes n where n.mid in {ids2str(memo_ords)} "
+    )
+    if not known_mods:
+        # 全件読み込み："text" を含まないノートは SQLite 側で落とす（空欄や "[]" など）
+        changed = list(current_mods)
+        rows = col.db.all(sql + "and instr(n.flds, ?) > 0", _MEMO_TEXT_KEY)
+    else:
+        # 差分読み込み：メモを消したノートも拾えるよう内容では絞らない
+        changed = [
+            nid for nid, mod in current_mods.items() if known_mods.get(nid) != mod
+        ]
+        rows = col.db.all(sql + f"and n.id in {ids2str(changed)}") if changed else []
+
+    by_nid = _entries_from_rows(rows, memo_ords, deck_names)
+    return by_nid, current_mods, changed
+
+
+# ===== 読み込み結果の永続キャッシュ（アドオン側の SQLite） =====
+#
+# 起動し直しても全ノートの JSON をパースし直さずに済むよう、
+# パース済みのメモと、読み込んだ時点の各ノートの mod を保存しておく。
+# 次回は notes.mod と食い違うノートだけを読み直す。
+
+_CACHE_VERSION = 1
+
+
+def _memo_cache_path(col_path: Optional[str]) -> Optional[str]:
+    """コレクションごとのキャッシュファイル（user_files 内）"""
+    if not col_path:
+        return None
+    folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "user_files")
+    digest = hashlib.sha1(col_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(folder, f"memo_cache_{digest}.sqlite")
+
+
+def _open_memo_cache(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(
+        """
+        create table if not exists meta (key text primary key, value integer);
+        create table if not exists note_mod (
+            nid integer primary key,
+            mod integer not null
+        );
+        create table if not exists memo_cache (
+            nid integer not null,
+            ts integer not null,
+            text text not null,
+            deck text not null,
+            front text not null
+        );
+        create index if not exists ix_memo_cache_nid on memo_cache (nid);
+        """
+    )
+    # 形式が変わったら作り直す
+    row = db.execute("select value from meta where key = 'version'").fetchone()
+    if row is None or row[0] != _CACHE_VERSION:
+        with db:
+            db.execute("delete from note_mod")
+            db.execute("delete from memo_cache")
+            db.execute(
+                "insert or replace into meta values ('version', ?)",
+                (_CACHE_VERSION,),
             )
+    return db
+
+
+def _load_memo_cache(
+    path: str,
+) -> Tuple[Dict[int, int], Dict[int, List[GlobalMemoEntry]]]:
+    """キャッシュから ({ノートID: mod}, {ノートID: メモ}) を読む"""
+    try:
+        db = _open_memo_cache(path)
+        try:
+            note_mods = dict(db.execute("select nid, mod from note_mod"))
+            by_nid: Dict[int, List[GlobalMemoEntry]] = {}
+            for nid, ts, text, deck, front in db.execute(
+                "select nid, ts, text, deck, front from memo_cache"
+            ):
+                by_nid.setdefault(nid, []).append(
+                    _make_global_entry(ts, text, nid, deck, front)
+                )
+        finally:
+            db.close()
+    except Exception:
+        # 壊れていたら空として扱う（全件読み込みになるだけ）
+        return {}, {}
+    return note_mods, by_nid
+
+
+def _update_memo_cache(
+    path: str,
+    changed_mods: Dict[int, int],
+    removed: List[int],
+    by_nid: Dict[int, List[GlobalMemoEntry]],
+) -> None:
+    """読み直したノート・消えたノートの分だけキャッシュを書き換える"""
+    stale = [(nid,) for nid in chain(changed_mods, removed)]
+    try:
+        db = _open_memo_cache(path)
+        try:
+            with db:
+                db.executemany("delete from note_mod where nid = ?", stale)
+                db.executemany("delete from memo_cache where nid = ?", stale)
+                db.executemany(
+                    "insert into note_mod values (?, ?)", changed_mods.items()
+                )
+                db.executemany(
+                    "insert into memo_cache values (?, ?, ?, ?, ?)",
+                    (
+                        (e.nid, e.ts, e.text, e.deck_name, e.front_snip)
+                        for entries in by_nid.values()
+                        for e in entries
+                    ),
+                )
+        finally:
+            db.close()
+    except Exception:
+        # キャッシュは無くても動くので、書けなければ諦める
+        pass
+
 
-    # 古い順（上から古い→下に新しい）に並べる
-    entries.sort(key=lambda e: e.ts)
-    return entries
+# (下限, 上限)。None はその側に制限なし
+_Bounds = Tuple[Optional[int], Optional[int]]
 
 
+def _day_start_ts(d: date) -> int:
+    """ローカル時刻で、その日の 0:00 の UNIX 時刻"""
+    return int(time.mktime(d.timetuple()))
+
+
+def _day_start_ts_clamped(d: date, days_after: int = 0) -> int:
+    """
+    d の days_after 日後の 0:00 の UNIX 時刻。
+    表せない日付（9999-12-31 の翌日、Windows での 1970 年より前など）は、
+    1970 年より前なら 0、それ以降なら sys.maxsize に寄せる。
+    """
+    try:
+        return _day_start_ts(d + timedelta(days=days_after))
+    except (OverflowError, ValueError, OSError):
+        return 0 if d.year < 1970 else sys.maxsize
+
 
 # ===== ブラウザでノートを開く =====
 
@@ -227,6 +556,348 @@ def open_note_in_browser(nid: int) -> None:
     b.search_for(f"nid:{nid}")
 
 
+# ===== HTML エクスポート用の固定部分 =====
+
+# シンプルなCSS（タイムラインの見た目をAnki内と近づける）
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang='en'>
+<head>
+<meta charset='utf-8'>
+<title>Memo Timeline</title>
+<style>
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+    background-color: #f5f7fb;
+    padding: 16px;
+}
+.memo-date {
+    background-color: #e8efff;
+    color: #1e3a8a;
+    padding: 4px 10px;
+    border-radius: 8px;
+    margin-top: 16px;
+    margin-bottom: 4px;
+    display: inline-block;
+    font-weight: bold;
+}
+.memo-list {
+    list-style-type: disc;
+    margin: 4px 0 0 24px;
+    padding: 0;
+}
+.memo-item {
+    margin: 2px 0;
+    line-height: 1.4;
+}
+</style>
+</head>
+<body>
+"""
+
+_HTML_TAIL = "</body>\n</html>\n"
+
+
+# ===== タイムライン表示用モデル =====
+
+# 空白行は中身が無いので、全行で同じタプルを共有する
+_SPACER_ROW: Tuple[str, Any] = ("spacer", None)
+
+# メモ行の行頭記号（本文は UserRole 側で持つので、表示専用）
+_BULLET = "• "
+
+# 一度に並べるメモの件数（上端までスクロールしたら、さらに古い分をこの件数ずつ足す）
+_LAZY_BATCH = 200
+
+
+class MemoListModel(QAbstractListModel):
+    """
+    タイムラインの行（日付ヘッダ・空白行・メモ）を保持するモデル。
+    行はただのタプルで持ち、QListView が表示中の行だけ data() を問い合わせる。
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # (kind, payload) のリスト
+        #   "header": 日付文字列 / "spacer": None
+        #   "memo": GlobalMemoEntry / "placeholder": 表示する文言
+        self._rows: List[Tuple[str, Any]] = []
+        # 最後に出した日付ヘッダ（追加時に逆順に探さなくて済むように）
+        self._last_header_iso: Optional[str] = None
+        # 表示中のメモ行数（上限チェックのたびに数え直さないように）
+        self.memo_count = 0
+        # 見た目用のオブジェクトは使い回す（data() のたびに作らない）
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+        self._header_bg = QBrush(QColor("#e8efff"))
+        self._header_fg = QBrush(QColor("#1e3a8a"))
+        self._spacer_size = QSize(-1, 8)  # 高さだけ少し
+
+    # ----- Qt から呼ばれる部分 -----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def flags(self, index):
+        if index.isValid() and self._rows[index.row()][0] == "memo":
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        return Qt.ItemFlag.NoItemFlags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, payload = self._rows[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if kind == "memo":
+                # メモ本体：時間は表示せずテキストだけ
+                return f"{_BULLET}{payload.text}"
+            if kind == "header":
+                return f"  {payload}  "
+            if kind == "placeholder":
+                return payload
+            return ""
+
+        if role == Qt.ItemDataRole.UserRole:
+            # kind, nid, ts, 本文 の4タプルで返す
+            if kind == "memo":
+                return ("memo", payload.nid, payload.ts, payload.text)
+            if kind == "header":
+                return ("header", None, None, None)
+            return None
+
+        if kind == "header":
+            if role == Qt.ItemDataRole.FontRole:
+                return self._header_font
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._header_bg
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._header_fg
+        elif kind == "spacer" and role == Qt.ItemDataRole.SizeHintRole:
+            return self._spacer_size
+
+        return None
+
+    # ----- パネルから呼ぶ部分 -----
+
+    def set_header_font(self, font: QFont) -> None:
+        self._header_font = font
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0),
+                self.index(len(self._rows) - 1),
+                [Qt.ItemDataRole.FontRole],
+            )
+
+    def set_placeholder(self, text: str) -> None:
+        """1行だけの案内表示（Loading... / No memo ...）にする"""
+        self.beginResetModel()
+        self._rows = [("placeholder", text)]
+        self._last_header_iso = None
+        self.memo_count = 0
+        self.endResetModel()
+
+    @staticmethod
+    def _build_rows(
+        entries: List[GlobalMemoEntry],
+    ) -> Tuple[List[Tuple[str, Any]], Optional[str]]:
+        """エントリ一覧から (行のリスト, 最後の日付) を作る"""
+        rows: List[Tuple[str, Any]] = []
+        append = rows.append  # ループ内の属性参照を減らす
+        last_date_str: Optional[str] = None
+
+        for e in entries:
+            date_str = e.date_iso
+
+            # 日付が変わったタイミングだけ、日付ヘッダを挿入
+            if date_str != last_date_str:
+                # ★ 直前にも日付があった場合だけ「空白行」を入れる
+                if last_date_str is not None:
+                    append(_SPACER_ROW)
+                append(("header", date_str))
+                last_date_str = date_str
+
+            append(("memo", e))
+
+        return rows, last_date_str
+
+    def set_entries(self, entries: List[GlobalMemoEntry]) -> None:
+        """
+        表示するエントリ一覧から行を組み立て直す。
+        今の行と先頭・末尾が共通なら、その間の違う部分だけ入れ替える。
+        """
+        rows, last_date_str = self._build_rows(entries)
+        old = self._rows
+
+        # 先頭・末尾から一致している行数を数える
+        limit = min(len(old), len(rows))
+        head = 0
+        while head < limit and old[head] == rows[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == rows[-1 - tail]:
+            tail += 1
+
+        if head == 0 and tail == 0:
+            # 共通部分が無ければ丸ごと差し替え
+            self.beginResetModel()
+            self._rows = rows
+            self._last_header_iso = last_date_str
+            self.memo_count = len(entries)
+            self.endResetModel()
+            return
+
+        old_end = len(old) - tail
+        new_end = len(rows) - tail
+        if old_end > head:
+            self.beginRemoveRows(QModelIndex(), head, old_end - 1)
+            del old[head:old_end]
+            self.endRemoveRows()
+        if new_end > head:
+            self.beginInsertRows(QModelIndex(), head, new_end - 1)
+            old[head:head] = rows[head:new_end]
+            self.endInsertRows()
+        self._last_header_iso = last_date_str
+        self.memo_count = len(entries)
+
+    def prepend_entries(self, entries: List[GlobalMemoEntry]) -> int:
+        """
+        先頭に古いエントリをまとめて追加する。
+        追加後、元の先頭の内容が何行目に来たかを返す。
+        """
+        if not entries:
+            return 0
+        rows, last_date_str = self._build_rows(entries)
+
+        if self._rows and self._rows[0][0] == "header":
+            if self._rows[0][1] == last_date_str:
+                # 同じ日が続くので、既存の日付ヘッダは不要
+                self.beginRemoveRows(QModelIndex(), 0, 0)
+                del self._rows[0]
+                self.endRemoveRows()
+            else:
+                rows.append(_SPACER_ROW)
+
+        self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+        self._rows[:0] = rows
+        self.memo_count += len(entries)
+        self.endInsertRows()
+        return len(rows)
+
+    def append_entry(self, e: GlobalMemoEntry) -> None:
+        """末尾に1件追加（必要なら日付ヘッダも）"""
+        if self._rows and self._rows[0][0] == "placeholder":
+            self.set_entries([e])
+            return
+
+        # 直近の日付ヘッダと違う日なら、新たに挿入
+        new_rows: List[Tuple[str, Any]] = []
+        if self._last_header_iso != e.date_iso:
+            # ★ すでにヘッダーがある（＝2日目以降）なら、その前に空白行
+            if self._last_header_iso is not None:
+                new_rows.append(_SPACER_ROW)
+            new_rows.append(("header", e.date_iso))
+            self._last_header_iso = e.date_iso
+        new_rows.append(("memo", e))
+
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.memo_count += 1
+        self.endInsertRows()
+
+    def remove_memo_row(self, row: int) -> None:
+        """メモ1行を取り除く（その日のメモが無くなればヘッダと空白行も）"""
+        if not (0 <= row < len(self._rows)) or self._rows[row][0] != "memo":
+            return
+        first = last = row
+        prev_is_header = row > 0 and self._rows[row - 1][0] == "header"
+        next_is_memo = row + 1 < len(self._rows) and self._rows[row + 1][0] == "memo"
+        if prev_is_header and not next_is_memo:
+            # その日の最後の1件 → ヘッダと、前後どちらかの空白行もまとめて消す
+            first = row - 1
+            if first > 0 and self._rows[first - 1][0] == "spacer":
+                first -= 1
+            elif last + 1 < len(self._rows) and self._rows[last + 1][0] == "spacer":
+                last += 1
+
+        self.beginRemoveRows(QModelIndex(), first, last)
+        del self._rows[first:last + 1]
+        self.memo_count -= 1
+        self.endRemoveRows()
+
+        # 末尾の日付グループを消した場合は、最後のヘッダを付け直す
+        self._last_header_iso = None
+        for kind, payload in reversed(self._rows):
+            if kind == "header":
+                self._last_header_iso = payload
+                break
+
+    def entry_at(self, row: int) -> Optional[GlobalMemoEntry]:
+        """メモ行なら、その行のエントリを返す"""
+        if 0 <= row < len(self._rows) and self._rows[row][0] == "memo":
+            return self._rows[row][1]
+        return None
+
+    def row_of(self, entry: GlobalMemoEntry, hint: int = -1) -> Optional[int]:
+        """entry を表示している行番号（無ければ None）。hint の行を先に確かめる"""
+        rows = self._rows
+        if 0 <= hint < len(rows) and rows[hint][1] is entry:
+            return hint
+        for i, (_kind, payload) in enumerate(rows):
+            if payload is entry:
+                return i
+        return None
+
+    def refresh_row(self, row: int) -> None:
+        """行の中身（メモ本文）が変わったことを通知"""
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.ItemDataRole.DisplayRole])
+
+
+# ===== メモ編集ダイアログ =====
+
+class _MemoEditDialog(QDialog):
+    """メモ1件の編集ダイアログ（フォントサイズはパネルに合わせる）"""
+
+    def __init__(self, parent, text: str, font_size: int) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Edit memo")
+
+        layout = QVBoxLayout(self)
+
+        label = QLabel("Memo:")
+        layout.addWidget(label)
+
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setPlainText(text)
+
+        # ★ここでフォントサイズをパネルと揃える
+        f = self.text_edit.font()
+        f.setPointSize(font_size)
+        self.text_edit.setFont(f)
+        self.text_edit.document().setDefaultFont(f)
+
+        layout.addWidget(self.text_edit)
+
+        # ボタン行
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        ok_btn = QPushButton("OK")
+        cancel_btn = QPushButton("Cancel")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(ok_btn)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+
+        self.resize(420, 260)
+
+    def get_text(self) -> str:
+        return self.text_edit.toPlainText()
+
+
 # ===== メモパネル本体 =====
 
 class CardMemoPanel(QDialog):
@@ -261,14 +932,42 @@ class CardMemoPanel(QDialog):
         self.current_deck_name: str = ""
         self.current_front_snip: str = ""
 
-        # 全メモタイムラインのキャッシュ（全件）
+        # ノートID -> そのノートのメモ（差分読み込み用の索引）
+        self._entries_by_nid: Dict[int, List[GlobalMemoEntry]] = {}
+        # 最後に読み込んだ時点の {ノートID: notes.mod} と、その対象コレクション
+        self._note_mods: Dict[int, int] = {}
+        self._scan_col_path: Optional[str] = None
+        # パネルから書き換えたノート（キャッシュファイルへの反映は次の再読み込みで）
+        self._dirty_nids: set = set()
+
+        # 全メモタイムラインのキャッシュ（全件・ts 昇順を保つ）
         self.entries: List[GlobalMemoEntry] = []
+        # self.entries と並行した ts のリスト（bisect 用）
+        self._ts_keys: List[int] = []
 
         # 表示件数の上限（configから読み込み）
         self.max_display_memos: int = _load_max_display_memos()
 
         # 現在のフィルタ種別: "all", "today", "7", "30", "custom"
         self.current_filter: str = "all"
+        # current_filter から求めた範囲のキャッシュ:
+        # (計算した日の ordinal, 日付 ordinal の範囲, ts の範囲)
+        self._filter_bounds_cache: Optional[Tuple[int, _Bounds, _Bounds]] = None
+        # リストに並べる件数（新しい方から）。上端までスクロールすると増える
+        self._display_limit = _LAZY_BATCH
+
+        # フィルタ変更・日付スピンの連打をまとめて1回の再描画にするタイマー
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(150)
+        self._rebuild_timer.timeout.connect(self._rebuild_list)
+
+        # ホイールでのズームは1フレーム分（約16ms）ためてから1回だけ反映
+        self._pending_font_delta = 0
+        self._font_timer = QTimer(self)
+        self._font_timer.setSingleShot(True)
+        self._font_timer.setInterval(16)
+        self._font_timer.timeout.connect(self._flush_font_change)
 
         # ===== レイアウト構築 =====
         layout = QVBoxLayout(self)
@@ -338,25 +1037,45 @@ class CardMemoPanel(QDialog):
 
 
         # タイムライン本体：リスト表示
-        self.list_widget = QListWidget()
-        self.list_widget.setWordWrap(True)  # ★ 長い文章を折り返し表示
-        self.list_widget.setHorizontalScrollBarPolicy(
+        # （見えている行だけ描画されるよう、モデル + ビューで持つ）
+        self.memo_model = MemoListModel(self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.memo_model)
+        self.list_view.setWordWrap(True)  # ★ 長い文章を折り返し表示
+        self.list_view.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-        )  # ★ 横スクロール禁止        
-        self.list_widget.setObjectName("MemoList")   # ★追加
-        layout.addWidget(self.list_widget)
+        )  # ★ 横スクロール禁止
+        self.list_view.setObjectName("MemoList")   # ★追加
+        # Shift / Ctrl で複数選択 → Delete キーでまとめて削除
+        self.list_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        layout.addWidget(self.list_view)
+
+        # 上端までスクロールしたら、さらに古いメモを読み足す
+        self.list_view.verticalScrollBar().valueChanged.connect(
+            self._on_list_scrolled
+        )
 
         # クリックでブラウザへジャンプ
-        self.list_widget.itemDoubleClicked.connect(self.on_item_clicked)
+        self.list_view.doubleClicked.connect(self.on_item_clicked)
 
         # コンテキストメニュー（右クリック）
-        self.list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.list_widget.customContextMenuRequested.connect(self.on_list_context_menu)
+        self.list_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(self.on_list_context_menu)
+        # メニュー自体は1回だけ作って使い回す
+        self._ctx_menu = QMenu(self)
+        self._act_edit = self._ctx_menu.addAction("Edit this memo")
+        self._act_del = self._ctx_menu.addAction("Delete this memo")
 
         # Deleteキーでメモ削除
-        self._shortcut_delete = QShortcut(QKeySequence("Delete"), self.list_widget)
+        self._shortcut_delete = QShortcut(QKeySequence("Delete"), self.list_view)
         self._shortcut_delete.activated.connect(self.delete_selected_memo)
 
+        # パネル上で Ctrl+Shift+M → パネルを隠す（メインウィンドウ側の「開く」と対になる）
+        self._shortcut_hide = QShortcut(QKeySequence("Ctrl+Shift+M"), self)
+        self._shortcut_hide.activated.connect(self.hide)
+
         # 下部：新規メモ入力
         layout.addWidget(QLabel("New memo for CURRENT card:"))
 
@@ -481,7 +1200,7 @@ class CardMemoPanel(QDialog):
                 """)
 
         # トラックパッド / ホイール + Ctrl でフォントサイズ変更を有効に
-        self.list_widget.installEventFilter(self)
+        self.list_view.installEventFilter(self)
         self.input_edit.installEventFilter(self)
 
         # 現在のフォントサイズを適用
@@ -503,9 +1222,9 @@ class CardMemoPanel(QDialog):
     def _apply_font_size(self) -> None:
         """現在のフォントサイズを各ウィジェットに適用"""
         # メモリスト
-        f_list = self.list_widget.font()
+        f_list = self.list_view.font()
         f_list.setPointSize(self.current_font_size)
-        self.list_widget.setFont(f_list)
+        self.list_view.setFont(f_list)
 
         # 入力欄
         f_input = self.input_edit.font()
@@ -520,16 +1239,11 @@ class CardMemoPanel(QDialog):
         f_info.setPointSize(max(8, self.current_font_size - 1))
         self.info_label.setFont(f_info)
 
-        # ★ 日付ヘッダーのフォントサイズも更新
-        for i in range(self.list_widget.count()):
-            it = self.list_widget.item(i)
-            data = it.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, tuple) and data[0] == "header":
-                font = it.font()
-                font.setBold(True)
-                font.setPointSize(max(8, self.current_font_size + 1))
-                it.setFont(font)
-        
+        # ★ 日付ヘッダーは本文より少し大きめの太字
+        f_header = QFont(f_list)
+        f_header.setBold(True)
+        f_header.setPointSize(max(8, self.current_font_size + 1))
+        self.memo_model.set_header_font(f_header)
 
 
     def _change_font_size(self, delta: int) -> None:
@@ -540,25 +1254,89 @@ class CardMemoPanel(QDialog):
         self.current_font_size = new_size
         self._apply_font_size()
 
+    def _flush_font_change(self) -> None:
+        """ためておいたホイール分のフォントサイズ変更をまとめて適用"""
+        delta = self._pending_font_delta
+        self._pending_font_delta = 0
+        if delta:
+            self._change_font_size(delta)
+
 
     # ===== 全メモ再読み込み（初回 & 明示リロード用） =====
 
     def reload_all_memos(self) -> None:
-        """QueryOp を使って全メモを再読み込み（進捗ウィンドウ付き）"""
-
-        # 一旦「Loading...」表示にしておく
-        self.list_widget.clear()
-        loading_item = QListWidgetItem("(Loading memos...)")
-        loading_item.setFlags(Qt.ItemFlag.NoItemFlags)
-        self.list_widget.addItem(loading_item)
+        """
+        QueryOp を使ってメモを再読み込み（進捗ウィンドウ付き）。
+        前回の読み込み結果（メモリ上 or キャッシュファイル）があれば、
+        mod が変わったノートだけを読み直す。
+        """
+        col_path = getattr(mw.col, "path", None)
+        if col_path != self._scan_col_path:
+            # 初回 or プロファイルが切り替わった
+            if self._dirty_nids and self._scan_col_path:
+                # 前のコレクションのキャッシュに、書き換えたノートを反映しておく
+                old_cache_path = _memo_cache_path(self._scan_col_path)
+                if old_cache_path:
+                    _update_memo_cache(old_cache_path, {}, list(self._dirty_nids), {})
+            self._entries_by_nid = {}
+            self._note_mods = {}
+            self._dirty_nids = set()
+            self._scan_col_path = col_path
+
+        cache_path = _memo_cache_path(col_path)
+        known_mods = dict(self._note_mods)
+        index = dict(self._entries_by_nid)
+        dirty = set(self._dirty_nids)
+
+        if not known_mods:
+            # パネルを開いて最初の読み込みのときだけ「Loading...」表示にしておく
+            self.memo_model.set_placeholder("(Loading memos...)")
 
         def _op(col):
             # バックグラウンドスレッド側で走る処理（GUI操作禁止）
-            return _collect_all_memo_entries(col)
+            nonlocal known_mods, index
+            if not known_mods and cache_path:
+                # 前回までの読み込み結果をキャッシュから復元
+                known_mods, index = _load_memo_cache(cache_path)
+                # パネルから書き換えたノートは、キャッシュの mod を信用しない
+                for nid in dirty:
+                    known_mods.pop(nid, None)
+
+            by_nid, current_mods, changed = _collect_memo_entries_by_note(
+                col, known_mods
+            )
+            removed = [
+                nid
+                for nid in set(known_mods).union(index, dirty)
+                if nid not in current_mods
+            ]
 
-        def _on_success(entries: List[GlobalMemoEntry]) -> None:
+            # 消えたノート・読み直したノートの古いメモを捨てて差し替え
+            for nid in chain(changed, removed):
+                index.pop(nid, None)
+            index.update(by_nid)
+
+            if cache_path and (changed or removed):
+                _update_memo_cache(
+                    cache_path,
+                    {nid: current_mods[nid] for nid in changed},
+                    removed,
+                    by_nid,
+                )
+
+            entries = list(chain.from_iterable(index.values()))
+            # 古い順（上から古い→下に新しい）に並べる
+            entries.sort(key=lambda e: e.ts)
+            return current_mods, index, entries
+
+        def _on_success(result) -> None:
             # メインスレッドに戻ってくる
-            self.entries = entries
+            self._note_mods, self._entries_by_nid, entries = result
+            # 読み込み中に書き換えたノートは、次の再読み込みまで未確定のまま
+            self._dirty_nids -= dirty
+            for nid in self._dirty_nids:
+                self._note_mods.pop(nid, None)
+            self._set_entries(entries)
             self._rebuild_list()
 
         QueryOp(
@@ -568,6 +1346,21 @@ class CardMemoPanel(QDialog):
         ).with_progress(label="Collecting card memos...").run_in_background()
 
 
+    def _mark_note_dirty(self, nid: int) -> None:
+        """
+        パネルから書き換えたノートは、次の再読み込みで必ず読み直す。
+        （notes.mod は秒単位なので、読み込みと同じ秒の更新は mod で区別できない）
+        キャッシュファイルへの反映は、次の再読み込みのバックグラウンド処理で行う。
+        """
+        self._mark_notes_dirty([nid])
+
+    def _mark_notes_dirty(self, nids: List[int]) -> None:
+        """_mark_note_dirty の複数ノート版"""
+        for nid in nids:
+            self._note_mods.pop(nid, None)
+        self._dirty_nids.update(nids)
+
+
     # ===== フィルタ変更 =====
 
     def on_filter_changed(self, _index: int) -> None:
@@ -583,12 +1376,16 @@ class CardMemoPanel(QDialog):
                   self.to_label, self.to_date_edit):
             w.setVisible(is_custom)
 
-        self._rebuild_list()
+        self._filter_bounds_cache = None
+        self._display_limit = _LAZY_BATCH
+        self._rebuild_timer.start()
 
     def on_custom_date_changed(self, _qdate) -> None:
         """カスタム日付が変更されたとき、Custom選択中ならリストを更新"""
         if self.current_filter == "custom":
-            self._rebuild_list()
+            self._filter_bounds_cache = None
+            self._display_limit = _LAZY_BATCH
+            self._rebuild_timer.start()
 
 
     def on_export_txt(self) -> None:
@@ -612,29 +1409,23 @@ class CardMemoPanel(QDialog):
         if not path:
             return
 
-        # 日付ごとにまとめてプレーンテキストを作成
-        lines: list[str] = []
-        last_date_str: Optional[str] = None
-
-        for e in entries:
-            d = date.fromtimestamp(e.ts)
-            date_str = d.isoformat()
-
-            if date_str != last_date_str:
-                # 日付が変わるタイミングで空行 + 日付見出し
-                if lines:
-                    lines.append("")
-                lines.append(date_str)
-                last_date_str = date_str
+        # 日付ごとにまとめて、1行ずつそのままファイルへ書き出す
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                last_date_str: Optional[str] = None
 
-            # タイムライン表示と同じく、時間は出さずテキストだけ
-            lines.append(f"  - {e.text}")
+                for e in entries:
+                    date_str = e.date_iso
 
-        text = "\n".join(lines)
+                    if date_str != last_date_str:
+                        # 日付が変わるタイミングで空行 + 日付見出し
+                        if last_date_str is not None:
+                            f.write("\n")
+                        f.write(f"{date_str}\n")
+                        last_date_str = date_str
 
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(text)
+                    # タイムライン表示と同じく、時間は出さずテキストだけ
+                    f.write(f"  - {e.text}\n")
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -670,82 +1461,31 @@ class CardMemoPanel(QDialog):
         if not path:
             return
 
-        # HTML本文を構築
-        lines: list[str] = []
-
-        lines.append("<!DOCTYPE html>")
-        lines.append("<html lang='en'>")
-        lines.append("<head>")
-        lines.append("<meta charset='utf-8'>")
-        lines.append("<title>Memo Timeline</title>")
-        # シンプルなCSS（タイムラインの見た目をAnki内と近づける）
-        lines.append("""
-<style>
-body {
-    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-    background-color: #f5f7fb;
-    padding: 16px;
-}
-.memo-date {
-    background-color: #e8efff;
-    color: #1e3a8a;
-    padding: 4px 10px;
-    border-radius: 8px;
-    margin-top: 16px;
-    margin-bottom: 4px;
-    display: inline-block;
-    font-weight: bold;
-}
-.memo-list {
-    list-style-type: disc;
-    margin: 4px 0 0 24px;
-    padding: 0;
-}
-.memo-item {
-    margin: 2px 0;
-    line-height: 1.4;
-}
-</style>
-""")
-        lines.append("</head>")
-        lines.append("<body>")
-
-        last_date_str: Optional[str] = None
-        opened_ul = False
-
-        for e in entries:
-            d = date.fromtimestamp(e.ts)
-            date_str = d.isoformat()
-
-            # 日付が切り替わるたびにヘッダ + 新しい <ul>
-            if date_str != last_date_str:
-                # 前の日付の<ul>を閉じる
-                if opened_ul:
-                    lines.append("</ul>")
-                    opened_ul = False
-
-                lines.append(
-                    f"<div class='memo-date'>{html.escape(date_str)}</div>"
-                )
-                lines.append("<ul class='memo-list'>")
-                opened_ul = True
-                last_date_str = date_str
+        # 本文は組み立てずに、日付ごと・メモごとに直接ファイルへ書き出す
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(_HTML_HEAD)
 
-            # メモ本文（HTMLエスケープ）
-            text_html = html.escape(e.text)
-            lines.append(f"<li class='memo-item'>{text_html}</li>")
+                last_date_str: Optional[str] = None
 
-        if opened_ul:
-            lines.append("</ul>")
+                for e in entries:
+                    date_str = e.date_iso
 
-        lines.append("</body>")
-        lines.append("</html>")
+                    # 日付が切り替わるたびに、前の <ul> を閉じてヘッダ + 新しい <ul>
+                    if date_str != last_date_str:
+                        close_ul = "</ul>\n" if last_date_str is not None else ""
+                        f.write(
+                            f"{close_ul}<div class='memo-date'>{html.escape(date_str)}</div>\n"
+                            "<ul class='memo-list'>\n"
+                        )
+                        last_date_str = date_str
 
-        html_text = "\n".join(lines)
+                    # メモ本文（HTMLエスケープ）
+                    f.write(f"<li class='memo-item'>{html.escape(e.text)}</li>\n")
 
-        try:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(html_text)
+                # entries は空でないので、最後の <ul> は必ず開いている
+                f.write("</ul>\n")
+                f.write(_HTML_TAIL)
         except Exception as exc:
             QMessageBox.warning(
                 self,
@@ -765,185 +1505,178 @@ body {
 
     # ===== エントリをフィルタしてリストを組み立て =====
 
-    def _filtered_entries(self) -> List[GlobalMemoEntry]:
-        if not self.entries:
-            return []
-
-        today = date.today()
-
-        def in_filter(e: GlobalMemoEntry) -> bool:
-            d = date.fromtimestamp(e.ts)
-
-            if self.current_filter == "today":
-                return d == today
-            elif self.current_filter == "7":
-                return d >= (today - timedelta(days=6))  # 今日含め7日間
-            elif self.current_filter == "30":
-                return d >= (today - timedelta(days=29))  # 今日含め30日間
-            elif self.current_filter == "custom":
-                try:
-                    from_d = self.from_date_edit.date().toPyDate()
-                    to_d = self.to_date_edit.date().toPyDate()
-                except Exception:
-                    # 万が一ウィジェットにアクセスできない場合はフィルタ無し扱い
-                    return True
-
-                if from_d and to_d:
-                    # うっかり From > To にしても動くようにスワップ
-                    if from_d > to_d:
-                        from_d, to_d = to_d, from_d
-                    return from_d <= d <= to_d
-
-                return True
-            else:
-                return True
-
-        filtered = [e for e in self.entries if in_filter(e)]
-
-        # 表示件数の上限を適用（新しい方を優先）
-        if self.max_display_memos and len(filtered) > self.max_display_memos:
-            filtered = filtered[-self.max_display_memos :]
-
-        return filtered
-
-    def _rebuild_list(self) -> None:
-        """self.entries + current_filter からリスト表示を作り直す"""
-        self.list_widget.clear()
-
-        entries = self._filtered_entries()
-        if not entries:
-            empty_item = QListWidgetItem("(No memo recorded for this filter.)")
-            empty_item.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.list_widget.addItem(empty_item)
-            return
-
-        last_date_str: Optional[str] = None
-
-        for e in entries:
-            d = date.fromtimestamp(e.ts)
-            date_str = d.isoformat()
-
-            # 日付が変わったタイミングだけ、日付ヘッダを挿入
-            if date_str != last_date_str:
-                # ★ 直前にも日付があった場合だけ「空白行」を入れる
-                if last_date_str is not None:
-                    spacer = QListWidgetItem("")
-                    spacer.setFlags(Qt.ItemFlag.NoItemFlags)
-                    spacer.setSizeHint(QSize(spacer.sizeHint().width(), 8))  # 高さだけ少し
-                    self.list_widget.addItem(spacer)
-
-                header_item = QListWidgetItem(date_str)
-                header_item.setData(Qt.ItemDataRole.UserRole, ("header", None, None))
-                header_item.setFlags(Qt.ItemFlag.NoItemFlags)
-
-                font = header_item.font()
-                font.setBold(True)
-                font.setPointSize(max(8, self.current_font_size + 1))  # 本文より少し大きめ
-                header_item.setFont(font)
-                header_item.setBackground(QColor("#e8efff"))
-                header_item.setForeground(QColor("#1e3a8a"))
-                header_item.setText("  " + date_str + "  ")
-
-                self.list_widget.addItem(header_item)
-                last_date_str = date_str
-
-            # メモ本体：時間は表示せずテキストだけ
-            display_text = "• " + e.text
-            memo_item = QListWidgetItem(display_text)
-
-            # kind, nid, ts の3タプルで保存
-            memo_item.setData(Qt.ItemDataRole.UserRole, ("memo", e.nid, e.ts))
-            self.list_widget.addItem(memo_item)
-
-        self.list_widget.scrollToBottom()
+    def _set_entries(self, entries: List[GlobalMemoEntry]) -> None:
+        """ts 昇順に並んだエントリ一覧でキャッシュを置き換える"""
+        self.entries = entries
+        self._ts_keys = [e.ts for e in entries]
 
-    # ===== 1件追加（メモ追加時） =====
-
-    def _entry_in_current_filter(self, e: GlobalMemoEntry) -> bool:
-        """1件が現在のフィルタ条件に入るか判定"""
+    def _filter_date_range(self) -> Tuple[Optional[date], Optional[date]]:
+        """現在のフィルタの (開始日, 終了日) を返す（None は制限なし）"""
         today = date.today()
-        d = date.fromtimestamp(e.ts)
 
         if self.current_filter == "today":
-            return d == today
+            return today, today
         elif self.current_filter == "7":
-            return d >= (today - timedelta(days=6))
+            return today - timedelta(days=6), None  # 今日含め7日間
         elif self.current_filter == "30":
-            return d >= (today - timedelta(days=29))
+            return today - timedelta(days=29), None  # 今日含め30日間
         elif self.current_filter == "custom":
             try:
                 from_d = self.from_date_edit.date().toPyDate()
                 to_d = self.to_date_edit.date().toPyDate()
             except Exception:
-                return True
+                # 万が一ウィジェットにアクセスできない場合はフィルタ無し扱い
+                return None, None
 
             if from_d and to_d:
+                # うっかり From > To にしても動くようにスワップ
                 if from_d > to_d:
                     from_d, to_d = to_d, from_d
-                return from_d <= d <= to_d
-            return True
+                return from_d, to_d
 
-        return True
+        return None, None
+
+    def _filter_bounds(self) -> Tuple[_Bounds, _Bounds]:
+        """
+        現在のフィルタを (日付 ordinal の閉区間, ts の半開区間 [lo, hi)) に直す。
+        None は制限なし。フィルタか日付が変わるまでは計算済みの値を使い回す。
+        """
+        today_ord = date.today().toordinal()
+        cached = self._filter_bounds_cache
+        if cached is not None and cached[0] == today_ord:
+            return cached[1], cached[2]
+
+        from_d, to_d = self._filter_date_range()
+        ord_bounds = (
+            from_d.toordinal() if from_d is not None else None,
+            to_d.toordinal() if to_d is not None else None,
+        )
+        # UNIX 時刻で表せない端は、表せる範囲の端に寄せる
+        ts_bounds = (
+            _day_start_ts_clamped(from_d) if from_d is not None else None,
+            _day_start_ts_clamped(to_d, 1) if to_d is not None else None,
+        )
+        self._filter_bounds_cache = (today_ord, ord_bounds, ts_bounds)
+        return ord_bounds, ts_bounds
+
+    def _filter_slice(self) -> Tuple[int, int]:
+        """現在のフィルタに入る self.entries の範囲 [lo, hi) を返す"""
+        # ソート済みの self._ts_keys を二分探索して切り出す
+        _, (lo_ts, hi_ts) = self._filter_bounds()
+        lo = 0
+        hi = len(self.entries)
+        if lo_ts is not None:
+            lo = bisect.bisect_left(self._ts_keys, lo_ts)
+        if hi_ts is not None:
+            hi = bisect.bisect_left(self._ts_keys, hi_ts)
+        return lo, max(lo, hi)
+
+    def _filtered_count(self, lo: int, hi: int) -> int:
+        """範囲 [lo, hi) のうち、表示件数の上限までで何件出せるか"""
+        count = hi - lo
+        if self.max_display_memos:
+            count = min(count, self.max_display_memos)
+        return count
+
+    def _filtered_entries(self) -> List[GlobalMemoEntry]:
+        if not self.entries:
+            return []
+
+        # 表示件数の上限を適用（新しい方を優先）
+        lo, hi = self._filter_slice()
+        return self.entries[hi - self._filtered_count(lo, hi) : hi]
+
+    def _rebuild_list(self) -> None:
+        """self.entries + current_filter からリスト表示を作り直す"""
+        # 並べるのは新しい方から _display_limit 件だけ（古い分はスクロールで足す）
+        lo, hi = self._filter_slice()
+        count = min(self._filtered_count(lo, hi), self._display_limit)
+        entries = self.entries[hi - count : hi]
+
+        # モデルのリセット → 末尾へのスクロールを、描画1回にまとめる
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            if not entries:
+                self.memo_model.set_placeholder("(No memo recorded for this filter.)")
+                return
+
+            self.memo_model.set_entries(entries)
+            self.list_view.scrollToBottom()
+        finally:
+            self.list_view.setUpdatesEnabled(True)
+            self.list_view.viewport().update()
+
+    # ===== 1件追加（メモ追加時） =====
+
+    def _entry_in_current_filter(self, e: GlobalMemoEntry) -> bool:
+        """1件が現在のフィルタ条件に入るか判定"""
+        (lo_ord, hi_ord), _ = self._filter_bounds()
+        return (lo_ord is None or e.day_ord >= lo_ord) and (
+            hi_ord is None or e.day_ord <= hi_ord
+        )
 
     def _append_entry(self, e: GlobalMemoEntry) -> None:
         """
         新しい1件のメモを self.entries に追加し、
         現在のフィルタに合うならリスト末尾に反映。
         """
-        self.entries.append(e)
+        # ts は単調増加なので、ふつうは末尾に足すだけ
+        at_end = not self._ts_keys or e.ts >= self._ts_keys[-1]
+        if at_end:
+            self._ts_keys.append(e.ts)
+            self.entries.append(e)
+        else:
+            # 時計が戻った等のときだけ ts 順を崩さない位置に挿入
+            pos = bisect.bisect_right(self._ts_keys, e.ts)
+            self._ts_keys.insert(pos, e.ts)
+            self.entries.insert(pos, e)
 
         # フィルタに引っかからない場合は、内部キャッシュだけ更新して終了
         if not self._entry_in_current_filter(e):
             return
 
-        # 上限を超えた場合は素直に全再描画（簡単＆そこそこ高速）
-        current_filtered = self._filtered_entries()
-        if self.max_display_memos and len(current_filtered) >= self.max_display_memos:
+        # 末尾以外に入った場合は並びごと作り直す
+        if not at_end:
             self._rebuild_list()
             return
 
-        # 直近の日付ヘッダを確認して、必要なら新たに挿入
-        d = date.fromtimestamp(e.ts)
-        date_str = d.isoformat()
-
-        last_header_date: Optional[str] = None
-        for i in range(self.list_widget.count() - 1, -1, -1):
-            it = self.list_widget.item(i)
-            data = it.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, tuple) and data[0] == "header":
-                # テキスト前後の空白を削って純粋な日付だけ比較する
-                last_header_date = it.text().strip()
-                break
-
-        if last_header_date != date_str:
-            # ★ すでにヘッダーがある（＝2日目以降）なら、その前に空白行
-            if last_header_date is not None:
-                spacer = QListWidgetItem("")
-                spacer.setFlags(Qt.ItemFlag.NoItemFlags)
-                spacer.setSizeHint(QSize(spacer.sizeHint().width(), 8))
-                self.list_widget.addItem(spacer)
+        # 上限に達している場合は、いちばん古い1件を先頭から外してから足す
+        if self.max_display_memos and self.memo_model.memo_count >= self.max_display_memos:
+            self.memo_model.remove_memo_row(1)  # 行0は日付ヘッダ
 
-            header_item = QListWidgetItem(date_str)
-            header_item.setData(Qt.ItemDataRole.UserRole, ("header", None, None))
-            header_item.setFlags(Qt.ItemFlag.NoItemFlags)
+        self.memo_model.append_entry(e)
+        self._display_limit = max(self._display_limit, self.memo_model.memo_count)
+        self.list_view.scrollToBottom()
 
-            font = header_item.font()
-            font.setBold(True)
-            font.setPointSize(max(8, self.current_font_size + 1))
-            header_item.setFont(font)
-            header_item.setBackground(QColor("#e8efff"))
-            header_item.setForeground(QColor("#1e3a8a"))
-            header_item.setText("  " + date_str + "  ")
+    # ===== 古いメモの読み足し（上端までスクロールしたとき） =====
 
-            self.list_widget.addItem(header_item)
+    def _on_list_scrolled(self, value: int) -> None:
+        # 作り直し中（描画停止中）のスクロール位置の変化は無視
+        if not self.list_view.updatesEnabled():
+            return
+        if value == self.list_view.verticalScrollBar().minimum():
+            self._load_older_memos()
 
+    def _load_older_memos(self) -> None:
+        """表示中の先頭より古いメモを _LAZY_BATCH 件だけ先頭に足す"""
+        shown = self.memo_model.memo_count
+        if not shown:
+            return
+        lo, hi = self._filter_slice()
+        available = self._filtered_count(lo, hi)
+        if shown >= available:
+            return
 
-        display_text = "• " + e.text
-        memo_item = QListWidgetItem(display_text)
-        memo_item.setData(Qt.ItemDataRole.UserRole, ("memo", e.nid, e.ts))
-        self.list_widget.addItem(memo_item)
+        n = min(_LAZY_BATCH, available - shown)
+        older = self.entries[hi - shown - n : hi - shown]
+        row = self.memo_model.prepend_entries(older)
+        self._display_limit = shown + n
 
-        self.list_widget.scrollToBottom()
+        # 見ていた位置（元の先頭）がずれないように合わせる
+        self.list_view.scrollTo(
+            self.memo_model.index(row),
+            QAbstractItemView.ScrollHint.PositionAtTop,
+        )
 
     # ===== 現在カードの情報更新（タイムラインは変えない）=====
 
@@ -964,15 +1697,7 @@ body {
         deck_name = mw.col.decks.name(card.did)
         self.current_deck_name = deck_name
 
-        model = note.model()
-        fnames = mw.col.models.field_names(model)
-        front_snip = ""
-        if fnames:
-            front_raw = note[fnames[0]]
-            import re
-            front_snip = re.sub(r"<[^>]+>", "", front_raw)
-            if len(front_snip) > 50:
-                front_snip = front_snip[:50] + "..."
+        front_snip = _front_snippet(note.fields[0]) if note.fields else ""
         self.current_front_snip = front_snip
 
         self.info_label.setText(
@@ -996,6 +1721,15 @@ body {
     def on_clear_input(self) -> None:
         self.input_edit.clear()
 
+    def _reset_input_after_add(self) -> None:
+        """追加後に入力欄を空にする（textChanged は飛ばさない）"""
+        self.input_edit.blockSignals(True)
+        try:
+            self.input_edit.clear()
+        finally:
+            self.input_edit.blockSignals(False)
+        self.input_edit.setFocus()
+
     def on_add_memo(self) -> None:
         """新しいメモを現在のノートに追加し、タイムラインに1件だけ反映"""
         text = self.input_edit.toPlainText().strip()
@@ -1010,7 +1744,17 @@ body {
             )
             return
 
+        # 直前（2秒以内）に同じノートへ同じ内容を追加したばかりなら、二重送信とみなす
+        ts = int(time.time())
+        if self.entries:
+            last = self.entries[-1]
+            if last.nid == self.current_nid and last.text == text and ts - last.ts < 2:
+                self._reset_input_after_add()
+                return
+
         # まず Reviewer が持っている Note を優先的に使う
+        # （col.get_note は毎回別の Note を返すので、Reviewer 側の Note が古いままになり、
+        #   そこから開いた編集ウィンドウが古い _MemoLog で上書きしてしまう）
         note = None
         reviewer = getattr(mw, "reviewer", None)
         if reviewer is not None and getattr(reviewer, "card", None):
@@ -1030,13 +1774,13 @@ body {
 
         # 既存ログを読み込み
         existing = _load_memo_log(note)
-        ts = int(time.time())
         new_entry_dict = {"ts": ts, "text": text}
         existing.append(new_entry_dict)
-        _save_memo_log(note, existing)
+        if _save_memo_log(note, existing):
+            self._mark_note_dirty(note.id)
 
         # 全体タイムライン用のエントリを組み立てて末尾に追加
-        new_global = GlobalMemoEntry(
+        new_global = _make_global_entry(
             ts=ts,
             text=text,
             nid=note.id,
@@ -1046,16 +1790,15 @@ body {
         self._append_entry(new_global)
 
         # 入力欄クリア
-        self.input_edit.clear()
-        self.input_edit.setFocus()
+        self._reset_input_after_add()
 
     # ===== リスト item クリック：ブラウザを開く =====
 
-    def on_item_clicked(self, item: QListWidgetItem) -> None:
-        data = item.data(Qt.ItemDataRole.UserRole)
+    def on_item_clicked(self, index: QModelIndex) -> None:
+        data = index.data(Qt.ItemDataRole.UserRole)
         if not isinstance(data, tuple):
             return
-        kind, nid, ts = data
+        kind, nid, ts, _text = data
         if kind != "memo" or not nid:
             return
         open_note_in_browser(int(nid))
@@ -1063,79 +1806,31 @@ body {
     # ===== コンテキストメニュー（右クリック） =====
 
     def on_list_context_menu(self, pos) -> None:
-        item = self.list_widget.itemAt(pos)
-        if not item:
+        index = self.list_view.indexAt(pos)
+        if not index.isValid():
             return
-        data = item.data(Qt.ItemDataRole.UserRole)
+        data = index.data(Qt.ItemDataRole.UserRole)
         if not isinstance(data, tuple):
             return
-        kind, nid, ts = data
+        kind, nid, ts, _text = data
         if kind != "memo" or not nid:
             return
 
-        menu = QMenu(self)
-        act_edit = menu.addAction("Edit this memo")      # ★追加
-        act_del = menu.addAction("Delete this memo")
-        chosen = menu.exec(self.list_widget.mapToGlobal(pos))
-        if chosen == act_edit:
-            self._edit_memo_item(item)                   # ★追加
-        elif chosen == act_del:
-            self._delete_memo_item(item)
+        chosen = self._ctx_menu.exec(self.list_view.viewport().mapToGlobal(pos))
+        if chosen == self._act_edit:
+            self._edit_memo_item(index)                  # ★追加
+        elif chosen == self._act_del:
+            self._delete_memo_item(index)
 
-    def _edit_memo_item(self, item: QListWidgetItem) -> None:
+    def _edit_memo_item(self, index: QModelIndex) -> None:
         """1件のメモ内容を編集する（フォントサイズ連動の専用ダイアログ版）"""
-        data = item.data(Qt.ItemDataRole.UserRole)
+        data = index.data(Qt.ItemDataRole.UserRole)
         if not isinstance(data, tuple):
             return
-        kind, nid, ts = data
+        kind, nid, ts, current_text = data
         if kind != "memo" or not nid:
             return
 
-        # 現在表示しているテキストから "• " を除去して本文だけ取り出す
-        display_text = item.text()
-        if display_text.startswith("• "):
-            current_text = display_text[2:]
-        else:
-            current_text = display_text
-
-        # ===== 専用の編集ダイアログを定義 =====
-        class _MemoEditDialog(QDialog):
-            def __init__(self, parent, text: str, font_size: int) -> None:
-                super().__init__(parent)
-                self.setWindowTitle("Edit memo")
-
-                layout = QVBoxLayout(self)
-
-                label = QLabel("Memo:")
-                layout.addWidget(label)
-
-                self.text_edit = QPlainTextEdit()
-                self.text_edit.setPlainText(text)
-
-                # ★ここでフォントサイズをパネルと揃える
-                f = self.text_edit.font()
-                f.setPointSize(font_size)
-                self.text_edit.setFont(f)
-                self.text_edit.document().setDefaultFont(f)
-
-                layout.addWidget(self.text_edit)
-
-                # ボタン行
-                btn_layout = QHBoxLayout()
-                btn_layout.addStretch()
-                ok_btn = QPushButton("OK")
-                cancel_btn = QPushButton("Cancel")
-                ok_btn.clicked.connect(self.accept)
-                cancel_btn.clicked.connect(self.reject)
-                btn_layout.addWidget(ok_btn)
-                btn_layout.addWidget(cancel_btn)
-                layout.addLayout(btn_layout)
-
-                self.resize(420, 260)
-
-            def get_text(self) -> str:
-                return self.text_edit.toPlainText()
-
         # ===== ダイアログを開く =====
         dlg = _MemoEditDialog(self, current_text, self.current_font_size)
         result = dlg.exec()
@@ -1162,45 +1857,98 @@ body {
 
         # _MemoLog(JSON) を書き換え
         logs = _load_memo_log(note)
-        changed = False
-        for ent in logs:
-            ets = int(ent.get("ts", 0))
-            if ets == int(ts):
-                ent["text"] = new_text
-                changed = True
-                break
-
-        if not changed:
+        pos = _find_memo_log_index(logs, int(ts), current_text)
+        if pos is None:
             QMessageBox.warning(
                 self,
                 "Edit memo",
                 "メモログ内に該当エントリが見つかりませんでした。",
             )
             return
+        logs[pos]["text"] = new_text
 
-        _save_memo_log(note, logs)
+        if _save_memo_log(note, logs):
+            self._mark_note_dirty(note.id)
 
-        # グローバルキャッシュ側のテキストも更新
-        for e in self.entries:
-            if e.nid == int(nid) and e.ts == int(ts):
-                e.text = new_text
-                break
+        # グローバルキャッシュ側のテキストも更新。
+        # ダイアログ表示中に並びが作り直されていることがあるので、行は探し直す
+        pos = self._entry_pos(int(nid), int(ts), current_text)
+        if pos is None:
+            return
+        entry = self.entries[pos]
+        row = self.memo_model.row_of(entry, index.row())
+        entry.text = new_text
 
         # リスト上の表示テキストも更新
-        item.setText("• " + new_text)
+        if row is not None:
+            self.memo_model.refresh_row(row)
 
 
     def delete_selected_memo(self) -> None:
-        item = self.list_widget.currentItem()
-        if not item:
+        indexes = [
+            idx for idx in self.list_view.selectionModel().selectedIndexes()
+            if self.memo_model.entry_at(idx.row()) is not None
+        ]
+        if len(indexes) > 1:
+            self._delete_memo_items(indexes)
+            return
+        index = indexes[0] if indexes else self.list_view.currentIndex()
+        if not index.isValid():
+            return
+        self._delete_memo_item(index)
+
+    def _delete_memo_items(self, indexes: List[QModelIndex]) -> None:
+        """選択された複数のメモをまとめて削除（ノートごとに1回だけ書き込む）"""
+        entries = [self.memo_model.entry_at(idx.row()) for idx in indexes]
+        entries = [e for e in entries if e is not None]
+        if not entries:
+            return
+
+        ret = QMessageBox.question(
+            self,
+            "Delete memo",
+            f"選択した {len(entries)} 件のメモを削除しますか？",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if ret != QMessageBox.StandardButton.Yes:
             return
-        self._delete_memo_item(item)
 
-    def _delete_memo_item(self, item: QListWidgetItem) -> None:
-        data = item.data(Qt.ItemDataRole.UserRole)
+        by_nid: Dict[int, List[GlobalMemoEntry]] = {}
+        for e in entries:
+            by_nid.setdefault(e.nid, []).append(e)
+
+        # ノートごとに _MemoLog から該当エントリを取り除く
+        changed_notes: List[Note] = []
+        for nid, targets in by_nid.items():
+            try:
+                note = mw.col.get_note(nid)
+            except NotFoundError:
+                # ブラウザなどでノートごと消された → 一覧から外すだけ
+                continue
+            logs = _load_memo_log(note)
+            for e in targets:
+                pos = _find_memo_log_index(logs, e.ts, e.text)
+                if pos is not None:
+                    del logs[pos]
+            if _set_memo_log(note, logs):
+                changed_notes.append(note)
+
+        # 書き込みは1回の呼び出しにまとめる
+        # （1件ずつの削除で使う note.flush() と同じく、取り消し履歴には積まない）
+        if changed_notes:
+            mw.col.update_notes(changed_notes, skip_undo_entry=True)
+            self._mark_notes_dirty([note.id for note in changed_notes])
+
+        for e in entries:
+            self._drop_entry(e.nid, e.ts, e.text)
+        self._rebuild_list()
+
+    def _delete_memo_item(self, index: QModelIndex) -> None:
+        data = index.data(Qt.ItemDataRole.UserRole)
         if not isinstance(data, tuple):
             return
-        kind, nid, ts = data
+        kind, nid, ts, target_text = data
         if kind != "memo" or not nid:
             return
 
@@ -1215,50 +1963,52 @@ body {
         if ret != QMessageBox.StandardButton.Yes:
             return
 
-        # 表示用テキスト ("• xxx") から実際のメモ本文だけを取り出す
-        target_text_display = item.text()
-        target_text = (
-            target_text_display[2:]
-            if target_text_display.startswith("• ")
-            else target_text_display
-        )
-
         note = mw.col.get_note(int(nid))
-        if note is None:
-            self.entries = [
-                e for e in self.entries
-                if not (e.nid == int(nid) and e.ts == int(ts) and e.text == target_text)
-            ]
+        if note is not None:
+            # Note側: _MemoLog から該当エントリを1件だけ削除
+            logs = _load_memo_log(note)
+            pos = _find_memo_log_index(logs, int(ts), target_text)
+            if pos is not None:
+                del logs[pos]
+                if _save_memo_log(note, logs):
+                    self._mark_note_dirty(note.id)
+
+        # グローバルキャッシュからも削除し、表示はその行だけ取り除く
+        # （確認ダイアログ中に並びが作り直されていることがあるので、行は探し直す）
+        pos = self._entry_pos(int(nid), int(ts), target_text)
+        if pos is None:
+            return
+        row = self.memo_model.row_of(self.entries[pos], index.row())
+        del self._ts_keys[pos]
+        del self.entries[pos]
+        if row is not None:
+            self._remove_view_row(row)
+
+    def _entry_pos(self, nid: int, ts: int, text: str) -> Optional[int]:
+        """self.entries で (nid, ts, text) が一致する1件の位置（無ければ None）"""
+        i = bisect.bisect_left(self._ts_keys, ts)
+        while i < len(self._ts_keys) and self._ts_keys[i] == ts:
+            e = self.entries[i]
+            if e.nid == nid and e.text == text:
+                return i
+            i += 1
+        return None
+
+    def _drop_entry(self, nid: int, ts: int, text: str) -> None:
+        """self.entries から (nid, ts, text) が一致する1件を取り除く"""
+        pos = self._entry_pos(nid, ts, text)
+        if pos is not None:
+            del self._ts_keys[pos]
+            del self.entries[pos]
+
+    def _remove_view_row(self, row: int) -> None:
+        """表示中の1行を消す。上限で隠れていた分が繰り上がる場合や空になった場合は再構築"""
+        if self.max_display_memos and self.memo_model.memo_count >= self.max_display_memos:
             self._rebuild_list()
             return
-
-        # Note側: _MemoLog から該当エントリを1件だけ削除
-        logs = _load_memo_log(note)
-
-        # 表示用テキスト ("• xxx") から実際のメモ本文だけを取り出す
-        target_text_display = item.text()
-        target_text = target_text_display[2:] if target_text_display.startswith("• ") else target_text_display
-        new_logs: List[Dict[str, Any]] = []
-        removed = False
-        for ent in logs:
-            ets = int(ent.get("ts", 0))
-            etext = str(ent.get("text", "")).strip()
-            if (not removed) and ets == int(ts) and etext == target_text:
-                removed = True
-                continue
-            new_logs.append(ent)
-
-        _save_memo_log(note, new_logs)
-
-        # グローバルキャッシュからも削除
-        self.entries = [
-            e
-            for e in self.entries
-            if not (e.nid == int(nid) and e.ts == int(ts) and e.text == target_text)
-        ]
-
-        # リスト再構築（ヘッダも含めてキレイに）
-        self._rebuild_list()
+        self.memo_model.remove_memo_row(row)
+        if self.memo_model.rowCount() == 0:
+            self._rebuild_list()
 
     def eventFilter(self, obj, event):
         # トラックパッドの二本指スクロール / マウスホイール + Ctrl(Win/Linux) or ⌘(macOS) で拡大縮小
@@ -1268,9 +2018,11 @@ body {
             if mods & (Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.MetaModifier):
                 delta = event.angleDelta().y()
                 if delta > 0:
-                    self._change_font_size(+1)
+                    self._pending_font_delta += 1
                 elif delta < 0:
-                    self._change_font_size(-1)
+                    self._pending_font_delta -= 1
+                if self._pending_font_delta and not self._font_timer.isActive():
+                    self._font_timer.start()
                 return True  # 通常のスクロールはキャンセル
         return super().eventFilter(obj, event)
 
@@ -1280,9 +2032,12 @@ body {
 def open_memo_panel() -> None:
     """Tools メニューやショートカットから呼ばれる"""
     panel: Optional[CardMemoPanel] = getattr(mw, "_card_memo_panel", None)
-    if panel is None or not panel.isVisible():
+    if panel is None:
         panel = CardMemoPanel(parent=None)
         mw._card_memo_panel = panel
+    elif not panel.isVisible():
+        # 閉じて（隠して）いたパネルは作り直さず、更新分だけ読み直す
+        panel.reload_all_memos()
 
     panel.show()
     panel.raise_()
@@ -1303,6 +2058,7 @@ def on_main_window_did_init(*args, **kwargs) -> None:
     mw.form.menuTools.addAction(act)
 
     # ショートカット（Ctrl+Shift+M）でパネルを開く
+    # （ブラウザでは同じキーが「ノートタイプを変更」なので、メインウィンドウ限定）
     sc = QShortcut(QKeySequence("Ctrl+Shift+M"), mw)
     sc.activated.connect(open_memo_panel)
     mw._card_memo_panel_shortcut = sc